@@ -30,37 +30,34 @@ __all__ = [
 ]
 
 import sys
+from array import array
 
-if sys.implementation.name == 'micropython':
-    def partial(function, *args):
+_MICROPYTHON = sys.implementation.name == 'micropython'
+
+if _MICROPYTHON:
+    import struct
+
+    class Struct(object):
         """
-        Substitute to Python's `functools.partial`
+        Substitute to Python's `struct.Struct`
         """
-        def _partial(*extra_args):
-            return function(*(args + extra_args))
-        return _partial
-else:
-    from functools import partial
 
-try:
-    from machine import I2C as machine_i2c
-except ImportError:
-    machine_i2c = None
+        def __init__(self, format):
+            self.format = format
 
-try:
-    from smbus2 import i2c_msg
-except ImportError:
-    i2c_msg = None
+        def pack(self, *values):
+            return struct.pack(self.format, *values)
 
-try:
-    import serial
-except ImportError:
-    serial = None
+        def pack_into(self, buffer, offset, *values):
+            struct.pack_into(self.format, buffer, offset, *values)
 
-try:
-    import usb.core as usb_core
-except ImportError:
-    usb_core = None
+        def unpack(self, buffer):
+            return struct.unpack(self.format, buffer)
+else:
+    from struct import Struct
+
+# Note: The optional dependencies (machine, smbus2, pyusb) are only imported by the classes that use them, so that
+# importing this module stays cheap and only loads the backend that is actually used.
 
 
 class MachineI2CBackend(object):
@@ -69,12 +66,17 @@ class MachineI2CBackend(object):
     """
 
     def __init__(self, i2c, address):
-        if machine_i2c is None:
+        try:
+            import machine  # Only ensures that the dependency is available
+        except ImportError:
             raise Exception("Missing dependency: machine.I2C (Micropython)")
         self.i2c = i2c
         self.address = address
 
     def read(self, length):
+        """
+        Reads `length` bytes from the Tic. Returns a bytes-like object that is passed as-is to the output formatters.
+        """
         return self.i2c.readfrom(self.address, length)
 
     def write(self, serialized):
@@ -87,62 +89,97 @@ class SMBus2Backend(object):
     """
 
     def __init__(self, bus, address):
-        if i2c_msg is None:
+        try:
+            from smbus2 import i2c_msg
+        except ImportError:
             raise Exception("Missing dependency: smbus2")
+        self.i2c_msg = i2c_msg
         self.address = address
         self.bus = bus
 
     def read(self, length):
-        read = i2c_msg.read(self.address, length)
+        """
+        Reads `length` bytes from the Tic. Returns a bytes-like object that is passed as-is to the output formatters.
+        """
+        read = self.i2c_msg.read(self.address, length)
         self.bus.i2c_rdwr(read)
-        return read.__bytes__()[0: length]
+        # `i2c_msg.__bytes__()` already returns exactly `length` bytes, so no need to slice (and copy) it again
+        return bytes(read)
 
     def write(self, serialized):
-        write = i2c_msg.write(self.address, serialized)
+        write = self.i2c_msg.write(self.address, serialized)
         self.bus.i2c_rdwr(write)
 
 
 # Output formatting functions ---------------------------------------------------
 
-def boolean(bit_index, value):
+# Note: The formatters accept any bytes-like `value` (bytes, bytearray, memoryview, or the `array` returned by pyusb)
+# and never copy it, so the data returned by the backends is decoded in place.
+
+# Precompiled structures for the fixed-width integer fields
+_UINT16 = Struct('<H')
+_UINT32 = Struct('<I')
+_INT16 = Struct('<h')
+_INT32 = Struct('<i')
+
+
+def make_boolean(bit_index):
     """
-    Returns `True` if the bit located at `bit_index` in the given `value` is set. Returns `False` otherwise.
-    The least-significant bit is at index 0.
+    Returns a formatter that returns `True` if the bit located at `bit_index` in the given 1-byte value is set, `False`
+    otherwise. The least-significant bit is at index 0. The bit mask is computed once upfront.
     """
-    int_value = int.from_bytes(bytearray(value), 'little')
-    return (int_value & (1 << bit_index)) != 0
+    mask = 1 << bit_index
 
+    def _boolean(value):
+        return (value[0] & mask) != 0
+    return _boolean
 
-def bit_range(start, end, value):
+
+def make_bit_range(start, end):
     """
-    Returns the bits between the `start` and `end` indices in the byte `value`.
+    Returns a formatter that returns the bits between the `start` and `end` indices in the given 1-byte value. The bit
+    mask is computed once upfront.
     """
-    int_value = int.from_bytes(bytearray(value), 'little')
-    binary = bin(int_value)
-    # Remove first two characters
-    binary = binary[2:]
-    # Extract bits
-    bits = ''.join(reversed(''.join(reversed(binary))[start:end + 1]))  # Use "reversed()" instead of the less verbose [::-1] to be compatible with micropython
-    # Convert to int
-    return int(bits, 2)
+    mask = (1 << (end - start + 1)) - 1
+
+    def _bit_range(value):
+        return (value[0] >> start) & mask
+    return _bit_range
 
 
-def signed_int(value):
+def signed_int16(value):
     """
-    Converts the given byte value to a signed integer.
+    Converts the given 2-byte value to a signed integer.
     """
-    result = int.from_bytes(bytearray(value), 'little')
-    num_bytes = len(value)
-    if result >= (1 << (num_bytes * 8 - 1)):
-        result -= (1 << (num_bytes * 8))
-    return result
+    return _INT16.unpack(value)[0]
+
+
+def signed_int32(value):
+    """
+    Converts the given 4-byte value to a signed integer.
+    """
+    return _INT32.unpack(value)[0]
+
+
+def unsigned_int8(value):
+    """
+    Converts the given 1-byte value to an unsigned integer.
+    """
+    return value[0]
 
 
-def unsigned_int(value):
+def unsigned_int16(value):
     """
-    Converts the given byte value to an unsigned integer.
+    Converts the given 2-byte value to an unsigned integer.
     """
-    return int.from_bytes(bytearray(value), 'little')
+    return _UINT16.unpack(value)[0]
+
+
+def unsigned_int32(value):
+    """
+    Converts the given 4-byte value to an unsigned integer.
+    """
+    return _UINT32.unpack(value)[0]
 
 
 # USB IDs ---------------------------------------------------
@@ -165,7 +202,7 @@ BLOCK_READ = 'BLOCK_READ'
 
 
 # See list of commands in the official documentation: https://www.pololu.com/docs/0J71/8
-COMMANDS = [
+COMMANDS = (
     ('set_target_position', 0xE0, THIRTY_TWO_BITS),
     ('set_target_velocity', 0xE3, THIRTY_TWO_BITS),
     ('halt_and_set_position', 0xEC, THIRTY_TWO_BITS),
@@ -186,187 +223,275 @@ COMMANDS = [
     ('set_current_limit', 0x91, THIRTY_TWO_BITS),
     ('set_decay_mode', 0x92, SEVEN_BITS),
     ('set_agc_option', 0x98, SEVEN_BITS),
-]
+)
 
 GET_VARIABLE_CMD = 0xA1
 GET_SETTING_CMD = 0xA8
 
+# Serialized command codes, sent as-is for quick commands (which have no parameter) or used as frame headers
+_COMMAND_CODES = tuple(code for _, code, _ in COMMANDS) + (GET_VARIABLE_CMD, GET_SETTING_CMD)
+_COMMAND_BYTES = {code: bytes((code,)) for code in _COMMAND_CODES}
+
+
+def _get_command_bytes(command_code):
+    """
+    Returns the serialized command code, without allocating it again for the known commands.
+    """
+    serialized = _COMMAND_BYTES.get(command_code)
+    if serialized is None:
+        return bytes((command_code,))
+    return serialized
+
+# Maximum number of bytes that can be fetched with a single "Get variable" or "Get setting" command
+MAX_BLOCK_READ_LENGTH = 15
+# Same over USB, where a single control transfer can return more data
+MAX_USB_BLOCK_READ_LENGTH = 128
+
 
 # Variables ---------------------------------------------------
 
 # See list of variables in the official documentation: https://www.pololu.com/docs/0J71/7
-VARIABLES = [
+VARIABLES = (
     # General status  -------------------------------------
-    ('operation_state', 0x00, 1, unsigned_int),
+    ('operation_state', 0x00, 1, unsigned_int8),
     ('misc_flags', 0x01, 1, None),
     ('error_status', 0x02, 2, None),
     ('error_occured', 0x04, 4, None),
 
     # Step planning ---------------------------------------
-    ('planning_mode', 0x09, 1, unsigned_int),
-    ('target_position', 0x0A, 4, signed_int),
-    ('target_velocity', 0x0E, 4, signed_int),
-    ('starting_speed', 0x12, 4, unsigned_int),
-    ('max_speed', 0x16, 4, unsigned_int),
-    ('max_deceleration', 0x1A, 4, unsigned_int),
-    ('max_acceleration', 0x1E, 4, unsigned_int),
-    ('current_position', 0x22, 4, signed_int),
-    ('current_velocity', 0x26, 4, signed_int),
-    ('acting_target_position', 0x2A, 4, signed_int),
-    ('time_since_last_step', 0x2E, 4, unsigned_int),
+    ('planning_mode', 0x09, 1, unsigned_int8),
+    ('target_position', 0x0A, 4, signed_int32),
+    ('target_velocity', 0x0E, 4, signed_int32),
+    ('starting_speed', 0x12, 4, unsigned_int32),
+    ('max_speed', 0x16, 4, unsigned_int32),
+    ('max_deceleration', 0x1A, 4, unsigned_int32),
+    ('max_acceleration', 0x1E, 4, unsigned_int32),
+    ('current_position', 0x22, 4, signed_int32),
+    ('current_velocity', 0x26, 4, signed_int32),
+    ('acting_target_position', 0x2A, 4, signed_int32),
+    ('time_since_last_step', 0x2E, 4, unsigned_int32),
 
     # Other -----------------------------------------------
-    ('device_reset', 0x32, 1, unsigned_int),
-    ('vin_voltage', 0x33, 2, unsigned_int),
-    ('uptime', 0x35, 4, unsigned_int),
-    ('encoder_position', 0x39, 4, signed_int),
-    ('rc_pulse', 0x3D, 2, unsigned_int),
-    ('analog_reading_scl', 0x3F, 2, unsigned_int),
-    ('analog_reading_sda', 0x41, 2, unsigned_int),
-    ('analog_reading_tx', 0x43, 2, unsigned_int),
-    ('analog_reading_rx', 0x45, 2, unsigned_int),
+    ('device_reset', 0x32, 1, unsigned_int8),
+    ('vin_voltage', 0x33, 2, unsigned_int16),
+    ('uptime', 0x35, 4, unsigned_int32),
+    ('encoder_position', 0x39, 4, signed_int32),
+    ('rc_pulse', 0x3D, 2, unsigned_int16),
+    ('analog_reading_scl', 0x3F, 2, unsigned_int16),
+    ('analog_reading_sda', 0x41, 2, unsigned_int16),
+    ('analog_reading_tx', 0x43, 2, unsigned_int16),
+    ('analog_reading_rx', 0x45, 2, unsigned_int16),
     ('digital_readings', 0x47, 1, None),
     ('pin_states', 0x48, 1, None),
-    ('step_mode', 0x49, 1, unsigned_int),
-    ('current_limit', 0x4A, 1, unsigned_int),
-    ('decay_mode', 0x4B, 1, unsigned_int),  # Not valid for 36v4
-    ('input_state', 0x4C, 1, unsigned_int),
-    ('input_after_averaging', 0x4D, 2, unsigned_int),
-    ('input_after_hysteresis', 0x4F, 2, unsigned_int),
-    ('input_after_scaling', 0x51, 4, signed_int),
+    ('step_mode', 0x49, 1, unsigned_int8),
+    ('current_limit', 0x4A, 1, unsigned_int8),
+    ('decay_mode', 0x4B, 1, unsigned_int8),  # Not valid for 36v4
+    ('input_state', 0x4C, 1, unsigned_int8),
+    ('input_after_averaging', 0x4D, 2, unsigned_int16),
+    ('input_after_hysteresis', 0x4F, 2, unsigned_int16),
+    ('input_after_scaling', 0x51, 4, signed_int32),
 
     # T249-only -------------------------------------------
-    ('last_motor_driver_error', 0x55, 1, unsigned_int),
-    ('agc_mode', 0x56, 1, unsigned_int),
-    ('agc_bottom_current_limit', 0x57, 1, unsigned_int),
-    ('agc_current_boost_steps', 0x58, 1, unsigned_int),
-    ('agc_frequency_limit', 0x59, 1, unsigned_int),
+    ('last_motor_driver_error', 0x55, 1, unsigned_int8),
+    ('agc_mode', 0x56, 1, unsigned_int8),
+    ('agc_bottom_current_limit', 0x57, 1, unsigned_int8),
+    ('agc_current_boost_steps', 0x58, 1, unsigned_int8),
+    ('agc_frequency_limit', 0x59, 1, unsigned_int8),
 
     # 36v4-only -------------------------------------------
     ('last_hp_driver_errors', 0xFF, 1, None),
-]
+)
+
+VARIABLES_BY_NAME = {variable[0]: variable for variable in VARIABLES}
 
 
 # Settings ---------------------------------------------------
 
 # See list of settings in the official documentation: https://www.pololu.com/docs/0J71/6
-SETTINGS = [
-    ('control_mode', 0x01, 1, unsigned_int),
+SETTINGS = (
+    ('control_mode', 0x01, 1, unsigned_int8),
 
     # Miscellaneous -------------------------------------------------
-    ('disable_safe_start', 0x03, 1, partial(boolean, 0)),
-    ('ignore_err_line_high', 0x04, 1, partial(boolean, 0)),
-    ('auto_clear_driver_error', 0x08, 1, partial(boolean, 0)),
-    ('never_sleep', 0x02, 1, partial(boolean, 0)),
-    ('vin_calibration', 0x14, 2, signed_int),
+    ('disable_safe_start', 0x03, 1, make_boolean(0)),
+    ('ignore_err_line_high', 0x04, 1, make_boolean(0)),
+    ('auto_clear_driver_error', 0x08, 1, make_boolean(0)),
+    ('never_sleep', 0x02, 1, make_boolean(0)),
+    ('vin_calibration', 0x14, 2, signed_int16),
 
     # Soft error response -------------------------------------------
-    ('soft_error_response', 0x53, 1, unsigned_int),
-    ('soft_error_position', 0x54, 4, signed_int),
-    ('current_limit_during_error', 0x31, 1, unsigned_int),
+    ('soft_error_response', 0x53, 1, unsigned_int8),
+    ('soft_error_position', 0x54, 4, signed_int32),
+    ('current_limit_during_error', 0x31, 1, unsigned_int8),
 
     # Serial --------------------------------------------------------
-    ('serial_baud_rate', 0x06, 2, unsigned_int),  # Returns odd result
-    ('serial_enable_alt_device_number', 0x6A, 1, partial(boolean, 7)),
-    ('serial_14bit_device_number', 0x0B, 1, partial(boolean, 3)),
-    ('serial_response_delay', 0x5E, 1, unsigned_int),
-    ('serial_command_timeout', 0x09, 2, unsigned_int),
-    ('serial_crc_for_commands', 0x0B, 1, partial(boolean, 0)),
-    ('serial_crc_for_responses', 0x0B, 1, partial(boolean, 1)),
-    ('serial_7bit_responses', 0x0B, 1, partial(boolean, 2)),
+    ('serial_baud_rate', 0x06, 2, unsigned_int16),  # Returns odd result
+    ('serial_enable_alt_device_number', 0x6A, 1, make_boolean(7)),
+    ('serial_14bit_device_number', 0x0B, 1, make_boolean(3)),
+    ('serial_response_delay', 0x5E, 1, unsigned_int8),
+    ('serial_command_timeout', 0x09, 2, unsigned_int16),
+    ('serial_crc_for_commands', 0x0B, 1, make_boolean(0)),
+    ('serial_crc_for_responses', 0x0B, 1, make_boolean(1)),
+    ('serial_7bit_responses', 0x0B, 1, make_boolean(2)),
     # Note: The device number and alternative device number settings are defined in the TicSerial class
 
     # Encoder -------------------------------------------------------
-    ('encoder_prescaler', 0x58, 4, unsigned_int),
-    ('encoder_postscaler', 0x37, 4, unsigned_int),
-    ('encoder_unlimited', 0x5C, 1, partial(boolean, 0)),
+    ('encoder_prescaler', 0x58, 4, unsigned_int32),
+    ('encoder_postscaler', 0x37, 4, unsigned_int32),
+    ('encoder_unlimited', 0x5C, 1, make_boolean(0)),
 
     # Input conditioning --------------------------------------------
-    ('input_averaging_enabled', 0x2E, 1, partial(boolean, 0)),
-    ('input_hysteresis', 0x2F, 2, unsigned_int),
+    ('input_averaging_enabled', 0x2E, 1, make_boolean(0)),
+    ('input_hysteresis', 0x2F, 2, unsigned_int16),
 
     # RC and analog scaling -----------------------------------------
-    ('input_invert', 0x21, 1, partial(boolean, 0)),
-    ('input_max', 0x28, 2, unsigned_int),
-    ('output_max', 0x32, 4, signed_int),
-    ('input_neutral_max', 0x26, 2, unsigned_int),
-    ('input_neutral_min', 0x24, 2, unsigned_int),
-    ('input_min', 0x22, 2, unsigned_int),
-    ('output_min', 0x2A, 4, signed_int),
-    ('input_scaling_degree', 0x20, 1, unsigned_int),
+    ('input_invert', 0x21, 1, make_boolean(0)),
+    ('input_max', 0x28, 2, unsigned_int16),
+    ('output_max', 0x32, 4, signed_int32),
+    ('input_neutral_max', 0x26, 2, unsigned_int16),
+    ('input_neutral_min', 0x24, 2, unsigned_int16),
+    ('input_min', 0x22, 2, unsigned_int16),
+    ('output_min', 0x2A, 4, signed_int32),
+    ('input_scaling_degree', 0x20, 1, unsigned_int8),
 
     # Pin Configuration ---------------------------------------------
     # SCL
     ('scl_config', 0x3B, 1, None),
-    ('scl_pin_function', 0x3B, 1, partial(bit_range, 0, 3)),
-    ('scl_enable_analog', 0x3B, 1, partial(boolean, 6)),
-    ('scl_enable_pull_up', 0x3B, 1, partial(boolean, 7)),
-    ('scl_active_high', 0x36, 1, partial(boolean, 0)),
-    ('scl_kill_switch', 0x5D, 1, partial(boolean, 0)),
-    ('scl_limit_switch_forward', 0x5F, 1, partial(boolean, 0)),
-    ('scl_limit_switch_reverse', 0x60, 1, partial(boolean, 0)),
+    ('scl_pin_function', 0x3B, 1, make_bit_range(0, 3)),
+    ('scl_enable_analog', 0x3B, 1, make_boolean(6)),
+    ('scl_enable_pull_up', 0x3B, 1, make_boolean(7)),
+    ('scl_active_high', 0x36, 1, make_boolean(0)),
+    ('scl_kill_switch', 0x5D, 1, make_boolean(0)),
+    ('scl_limit_switch_forward', 0x5F, 1, make_boolean(0)),
+    ('scl_limit_switch_reverse', 0x60, 1, make_boolean(0)),
     # SDA
     ('sda_config', 0x3C, 1, None),
-    ('sda_pin_function', 0x3C, 1, partial(bit_range, 0, 3)),
-    ('sda_enable_analog', 0x3C, 1, partial(boolean, 6)),
-    ('sda_enable_pull_up', 0x3C, 1, partial(boolean, 7)),
-    ('sda_active_high', 0x36, 1, partial(boolean, 1)),
-    ('sda_kill_switch', 0x5D, 1, partial(boolean, 1)),
-    ('sda_limit_switch_forward', 0x5F, 1, partial(boolean, 1)),
-    ('sda_limit_switch_reverse', 0x60, 1, partial(boolean, 1)),
+    ('sda_pin_function', 0x3C, 1, make_bit_range(0, 3)),
+    ('sda_enable_analog', 0x3C, 1, make_boolean(6)),
+    ('sda_enable_pull_up', 0x3C, 1, make_boolean(7)),
+    ('sda_active_high', 0x36, 1, make_boolean(1)),
+    ('sda_kill_switch', 0x5D, 1, make_boolean(1)),
+    ('sda_limit_switch_forward', 0x5F, 1, make_boolean(1)),
+    ('sda_limit_switch_reverse', 0x60, 1, make_boolean(1)),
     # TX
     ('tx_config', 0x3D, 1, None),
-    ('tx_pin_function', 0x3D, 1, partial(bit_range, 0, 3)),
-    ('tx_enable_analog', 0x3D, 1, partial(boolean, 6)),
-    ('tx_active_high', 0x36, 1, partial(boolean, 2)),
-    ('tx_kill_switch', 0x5D, 1, partial(boolean, 2)),
-    ('tx_limit_switch_forward', 0x5F, 1, partial(boolean, 2)),
-    ('tx_limit_switch_reverse', 0x60, 1, partial(boolean, 2)),
+    ('tx_pin_function', 0x3D, 1, make_bit_range(0, 3)),
+    ('tx_enable_analog', 0x3D, 1, make_boolean(6)),
+    ('tx_active_high', 0x36, 1, make_boolean(2)),
+    ('tx_kill_switch', 0x5D, 1, make_boolean(2)),
+    ('tx_limit_switch_forward', 0x5F, 1, make_boolean(2)),
+    ('tx_limit_switch_reverse', 0x60, 1, make_boolean(2)),
     # RX
     ('rx_config', 0x3E, 1, None),
-    ('rx_pin_function', 0x3E, 1, partial(bit_range, 0, 3)),
-    ('rx_enable_analog', 0x3E, 1, partial(boolean, 6)),
-    ('rx_active_high', 0x36, 1, partial(boolean, 3)),
-    ('rx_kill_switch', 0x5D, 1, partial(boolean, 3)),
-    ('rx_limit_switch_forward', 0x5F, 1, partial(boolean, 3)),
-    ('rx_limit_switch_reverse', 0x60, 1, partial(boolean, 3)),
+    ('rx_pin_function', 0x3E, 1, make_bit_range(0, 3)),
+    ('rx_enable_analog', 0x3E, 1, make_boolean(6)),
+    ('rx_active_high', 0x36, 1, make_boolean(3)),
+    ('rx_kill_switch', 0x5D, 1, make_boolean(3)),
+    ('rx_limit_switch_forward', 0x5F, 1, make_boolean(3)),
+    ('rx_limit_switch_reverse', 0x60, 1, make_boolean(3)),
     # RC
     ('rc_config', 0x3F, 1, None),
-    ('rc_active_high', 0x36, 1, partial(boolean, 4)),
-    ('rc_kill_switch', 0x5D, 1, partial(boolean, 4)),
-    ('rc_limit_switch_forward', 0x5F, 1, partial(boolean, 4)),
-    ('rc_limit_switch_reverse', 0x60, 1, partial(boolean, 4)),
+    ('rc_active_high', 0x36, 1, make_boolean(4)),
+    ('rc_kill_switch', 0x5D, 1, make_boolean(4)),
+    ('rc_limit_switch_forward', 0x5F, 1, make_boolean(4)),
+    ('rc_limit_switch_reverse', 0x60, 1, make_boolean(4)),
 
     # Motor ---------------------------------------------------------
-    ('invert_motor_direction', 0x1B, 1, partial(boolean, 0)),
-    ('max_speed', 0x47, 4, unsigned_int),
-    ('starting_speed', 0x43, 4, unsigned_int),
-    ('max_acceleration', 0x4F, 4, unsigned_int),
-    ('max_deceleration', 0x4B, 4, unsigned_int),
-    ('step_mode', 0x41, 1, unsigned_int),
-    ('current_limit', 0x40, 1, unsigned_int),
-    ('decay_mode', 0x42, 1, unsigned_int),
+    ('invert_motor_direction', 0x1B, 1, make_boolean(0)),
+    ('max_speed', 0x47, 4, unsigned_int32),
+    ('starting_speed', 0x43, 4, unsigned_int32),
+    ('max_acceleration', 0x4F, 4, unsigned_int32),
+    ('max_deceleration', 0x4B, 4, unsigned_int32),
+    ('step_mode', 0x41, 1, unsigned_int8),
+    ('current_limit', 0x40, 1, unsigned_int8),
+    ('decay_mode', 0x42, 1, unsigned_int8),
 
     # Homing --------------------------------------------------------
-    ('auto_homing', 0x02, 1, partial(boolean, 1)),
-    ('auto_homing_forward', 0x03, 1, partial(boolean, 2)),
-    ('homing_speed_towards', 0x61, 4, unsigned_int),
-    ('homing_speed_away', 0x65, 4, unsigned_int),
+    ('auto_homing', 0x02, 1, make_boolean(1)),
+    ('auto_homing_forward', 0x03, 1, make_boolean(2)),
+    ('homing_speed_towards', 0x61, 4, unsigned_int32),
+    ('homing_speed_away', 0x65, 4, unsigned_int32),
 
     # T249-only -----------------------------------------------------
-    ('agc_mode', 0x6C, 1, unsigned_int),
-    ('agc_bottom_current_limit', 0x6D, 1, unsigned_int),
-    ('agc_current_boost_steps', 0x6E, 1, unsigned_int),
-    ('agc_frequency_limit', 0x6F, 1, unsigned_int),
+    ('agc_mode', 0x6C, 1, unsigned_int8),
+    ('agc_bottom_current_limit', 0x6D, 1, unsigned_int8),
+    ('agc_current_boost_steps', 0x6E, 1, unsigned_int8),
+    ('agc_frequency_limit', 0x6F, 1, unsigned_int8),
 
     # 36v4-only -----------------------------------------------------
-    ('hp_enable_unrestricted_current_limits', 0x6C, 1, partial(boolean, 0)),
-    ('hp_fixed_off_time', 0xF6, 1, unsigned_int),
-    ('hp_current_trip_blanking_time', 0xF8, 1, unsigned_int),
-    ('hp_enable_adaptive_blanking_time', 0xF9, 1, partial(boolean, 0)),
-    ('hp_mixed_decay_transition_time', 0xFA, 1, unsigned_int),
-    ('hp_decay_mode', 0xFB, 1, unsigned_int),
-]
+    ('hp_enable_unrestricted_current_limits', 0x6C, 1, make_boolean(0)),
+    ('hp_fixed_off_time', 0xF6, 1, unsigned_int8),
+    ('hp_current_trip_blanking_time', 0xF8, 1, unsigned_int8),
+    ('hp_enable_adaptive_blanking_time', 0xF9, 1, make_boolean(0)),
+    ('hp_mixed_decay_transition_time', 0xFA, 1, unsigned_int8),
+    ('hp_decay_mode', 0xFB, 1, unsigned_int8),
+)
+
+SETTINGS_BY_NAME = {setting[0]: setting for setting in SETTINGS}
+
+
+def _get_ranges(table):
+    """
+    Returns the list of `(start, length)` offset ranges covering all the entries in the given table of variables or
+    settings. Entries separated by small gaps are merged into the same range so they can be fetched together.
+    """
+    ranges = []
+    for _, offset, length, _ in sorted(table, key=lambda entry: entry[1]):
+        if ranges and offset - (ranges[-1][0] + ranges[-1][1]) < MAX_BLOCK_READ_LENGTH:
+            start = ranges[-1][0]
+            ranges[-1] = (start, max(ranges[-1][1], offset + length - start))
+        else:
+            ranges.append((offset, length))
+    return ranges
+
+
+# Offsets of the lower and upper bytes of the serial device numbers, which are spread over two separate settings
+SERIAL_DEVICE_NUMBER_OFFSETS = (0x07, 0x69)
+SERIAL_ALT_DEVICE_NUMBER_OFFSETS = (0x6A, 0x6B)
+
+VARIABLES_RANGES = _get_ranges(VARIABLES)
+SETTINGS_RANGES = _get_ranges(
+    SETTINGS + tuple(
+        (None, offset, 1, None) for offset in SERIAL_DEVICE_NUMBER_OFFSETS + SERIAL_ALT_DEVICE_NUMBER_OFFSETS))
+
+
+def _decode(data, offset, length, format_response):
+    """
+    Decodes the specified variable or setting from the buffer returned by `TicBase._read_ranges()`.
+    """
+    # Slicing a memoryview lets the formatters decode the data in place, without copying it
+    value = memoryview(data)[offset:offset + length]
+    if format_response is None:
+        return bytes(value)
+    return format_response(value)
+
+
+def _decode_all(table, data):
+    """
+    Decodes all the entries of the given table of variables or settings from the buffer returned by
+    `TicBase._read_ranges()`. Returns a dictionary of names and values.
+    """
+    data = memoryview(data)
+    result = {}
+    for entry in table:
+        name, offset, length, format_response = entry
+        result[name] = _decode(data, offset, length, format_response)
+    return result
+
+
+def _get_device_number(lower, upper):
+    """
+    Combines the lower and upper bytes of a serial device number.
+    """
+    return (lower[0] & 0x7F) | ((upper[0] & 0x7F) << 7)
+
+
+def _make_setting_method(offset, length, format_response):
+    """
+    Returns a method that reads the specified setting from the Tic.
+    """
+    def getter(self, fresh=False):
+        return self._read(offset, length, format_response, fresh)
+    return getter
 
 
 class Settings(object):
@@ -376,54 +501,144 @@ class Settings(object):
 
     def __init__(self, tic):
         self.tic = tic
+        # Copy of all settings fetched by `refresh()`, or `None` if the settings are read from the Tic on each call
+        self._cache = None
+
+    @classmethod
+    def _define_settings(cls):
+        """
+        Defines methods for all Tic settings. Called only once, when this module is loaded, so that instantiating
+        controllers doesn't have to bind a getter for every setting.
+        """
         for setting in SETTINGS:
             name, offset, length, format_response = setting
-            setattr(
-                self,
-                'get_' + name,
-                partial(self.tic._block_read, GET_SETTING_CMD, offset, length, format_response))
+            setattr(cls, 'get_' + name, _make_setting_method(offset, length, format_response))
+
+    def refresh(self):
+        """
+        Fetches all settings from the Tic at once and caches them. Until `invalidate()` is called, the getters then
+        return the cached values instead of sending a separate block read for each setting. Individual getters can
+        still fetch their current value from the Tic by passing `fresh=True`.
+        """
+        self._cache = self.tic._read_ranges(GET_SETTING_CMD, SETTINGS_RANGES)
+
+    def invalidate(self):
+        """
+        Discards the settings cached by `refresh()`.
+        """
+        self._cache = None
 
-    def get_serial_device_number(self):
+    def _read(self, offset, length, format_response=None, fresh=False):
+        """
+        Returns the value of the specified setting, from the cache if available.
+        """
+        if self._cache is None or fresh:
+            return self.tic._block_read(GET_SETTING_CMD, offset, length, format_response)
+        return _decode(self._cache, offset, length, format_response)
+
+    def get_serial_device_number(self, fresh=False):
         """
         Gets the serial device number from two separate bytes in the Tic's settings.
         """
-        lower = self.tic._block_read(GET_SETTING_CMD, 0x07, 1)
-        upper = self.tic._block_read(GET_SETTING_CMD, 0x69, 1)
-        lower = bit_range(0, 6, lower)
-        upper = bit_range(0, 6, upper)
-        return (lower & 0x7F) | ((upper & 0x7F) << 7)
+        return self._read_device_number(SERIAL_DEVICE_NUMBER_OFFSETS, fresh)
 
-    def get_serial_alt_device_number(self):
+    def get_serial_alt_device_number(self, fresh=False):
         """
         Gets the alternative serial device number from two separate bytes in the Tic's settings.
         """
-        lower = self.tic._block_read(GET_SETTING_CMD, 0x6A, 1)
-        upper = self.tic._block_read(GET_SETTING_CMD, 0x6B, 1)
-        lower = bit_range(0, 6, lower)
-        upper = bit_range(0, 6, upper)
-        return (lower & 0x7F) | ((upper & 0x7F) << 7)
+        return self._read_device_number(SERIAL_ALT_DEVICE_NUMBER_OFFSETS, fresh)
+
+    def _read_device_number(self, offsets, fresh=False):
+        """
+        Reads the lower and upper bytes of a serial device number located at the given offsets.
+        """
+        lower, upper = offsets
+        if self._cache is not None and not fresh:
+            return _get_device_number(self._cache[lower:lower + 1], self._cache[upper:upper + 1])
+        if upper == lower + 1:
+            # Adjacent bytes can be fetched with a single block read
+            data = self.tic._block_read(GET_SETTING_CMD, lower, 2)
+            return _get_device_number(data[0:1], data[1:2])
+        return _get_device_number(
+            self.tic._block_read(GET_SETTING_CMD, lower, 1), self.tic._block_read(GET_SETTING_CMD, upper, 1))
 
     def get_all(self):
         """
         Returns all of the Tic's settings and their values.
         """
-        result = {}
-        for setting in SETTINGS:
-            name, _, _, _ = setting
-            result[name] = getattr(self, 'get_' + name)()
-        result['serial_device_number'] = self.get_serial_device_number()
-        result['serial_alt_device_number'] = self.get_serial_alt_device_number()
+        data = self._cache
+        if data is None:
+            # Fetch all settings at once instead of sending a separate block read for each setting
+            data = self.tic._read_ranges(GET_SETTING_CMD, SETTINGS_RANGES)
+        result = _decode_all(SETTINGS, data)
+        # Reuse the fetched bytes instead of reading the device numbers again
+        lower, upper = SERIAL_DEVICE_NUMBER_OFFSETS
+        result['serial_device_number'] = _get_device_number(data[lower:lower + 1], data[upper:upper + 1])
+        lower, upper = SERIAL_ALT_DEVICE_NUMBER_OFFSETS
+        result['serial_alt_device_number'] = _get_device_number(data[lower:lower + 1], data[upper:upper + 1])
         return result
 
 
+Settings._define_settings()
+
+
 # Main classes -----------------------------------------------
 
+def _make_command_method(command_code, format):
+    """
+    Returns a method that sends the specified command to the Tic. The method is specialized for the command's input
+    format, so that it calls the matching `_send_*()` method directly instead of dispatching on the format at runtime.
+    """
+    if format == QUICK:
+        def command(self):
+            return self._send_quick(command_code)
+    elif format == SEVEN_BITS:
+        def command(self, value):
+            return self._send_seven_bits(command_code, value)
+    else:
+        def command(self, value):
+            return self._send_thirty_two_bits(command_code, value)
+    return command
+
+
+def _make_variable_method(offset, length, format_response):
+    """
+    Returns a method that reads the specified variable from the Tic.
+    """
+    def getter(self):
+        data = self._variables
+        if data is not None:
+            # Inside a `batch()` block: decode the variable from the snapshot instead of reading it from the Tic
+            return _decode(data, offset, length, format_response)
+        return self._block_read(GET_VARIABLE_CMD, offset, length, format_response)
+    return getter
+
+
+class _Batch(object):
+    """
+    Context manager returned by `TicBase.batch()`. Implemented as a class since Micropython has no `contextlib`.
+    """
+
+    def __init__(self, tic):
+        self.tic = tic
+        self.previous = None
+
+    def __enter__(self):
+        tic = self.tic
+        self.previous = tic._variables
+        tic._variables = tic._read_ranges(GET_VARIABLE_CMD, VARIABLES_RANGES)
+        return tic
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.tic._variables = self.previous
+
+
 class TicBase(object):
 
     def __init__(self):
-        self._define_commands()
-        self._define_variables()
         self.settings = Settings(self)
+        # Snapshot of all variables taken by `batch()`, if any
+        self._variables = None
 
     def _send_command(self, command_code, format, value=None):
         """
@@ -431,56 +646,131 @@ class TicBase(object):
         """
         raise NotImplementedError
 
+    def _send_quick(self, command_code):
+        """
+        Sends a command that has no parameter. Child classes may override it to skip the format dispatch.
+        """
+        return self._send_command(command_code, QUICK)
+
+    def _send_seven_bits(self, command_code, value):
+        """
+        Sends a command that has a 7-bit parameter. Child classes may override it to skip the format dispatch.
+        """
+        return self._send_command(command_code, SEVEN_BITS, value)
+
+    def _send_thirty_two_bits(self, command_code, value):
+        """
+        Sends a command that has a 32-bit parameter. Child classes may override it to skip the format dispatch.
+        """
+        return self._send_command(command_code, THIRTY_TWO_BITS, value)
+
     def _block_read(self, command_code, offset, length, format_response=None):
         """
         Returns the value of the specified variable or setting. Must be defined by child classes.
         """
         raise NotImplementedError
 
-    def _define_commands(self):
+    # Maximum number of bytes fetched by a single `_block_read()`, which drivers may raise if their bus allows it
+    max_block_read_length = MAX_BLOCK_READ_LENGTH
+
+    def _read_ranges(self, command_code, ranges):
         """
-        Defines methods for all Tic commands.
+        Fetches the given `(start, length)` ranges of variables or settings with as few block reads as possible.
+        Returns a 256-byte buffer in which each fetched byte is located at its own offset.
+        """
+        data = bytearray(256)
+        max_length = self.max_block_read_length
+        for start, length in ranges:
+            end = start + length
+            while start < end:
+                block_length = min(max_length, end - start)
+                data[start:start + block_length] = self._block_read(command_code, start, block_length)
+                start += block_length
+        return data
+
+    @classmethod
+    def _define_commands(cls):
+        """
+        Defines methods for all Tic commands. Called only once, when this module is loaded, so that instantiating
+        controllers doesn't have to rebind every method.
         """
         for command in COMMANDS:
             name, code, format = command
-            setattr(self, name, partial(self._send_command, code, format))
+            setattr(cls, name, _make_command_method(code, format))
 
-    def _define_variables(self):
+    @classmethod
+    def _define_variables(cls):
         """
-        Defines methods for all Tic variables.
+        Defines methods for all Tic variables. Called only once, when this module is loaded.
         """
-        self.variables = {}
         for variable in VARIABLES:
             name, offset, length, format_response = variable
-            setattr(
-                self,
-                'get_' + name,
-                partial(self._block_read, GET_VARIABLE_CMD, offset, length, format_response))
+            setattr(cls, 'get_' + name, _make_variable_method(offset, length, format_response))
 
     def get_variables(self):
         """
-        Returns all Tic variables and their values.
+        Returns all Tic variables and their values, from the snapshot taken by `batch()` if any.
         """
-        result = {}
-        for variable in VARIABLES:
-            name, _, _, _ = variable
-            result[name] = getattr(self, 'get_' + name)()
-        return result
+        data = self._variables
+        if data is None:
+            # Fetch all variables at once instead of sending a separate block read for each variable
+            data = self._read_ranges(GET_VARIABLE_CMD, VARIABLES_RANGES)
+        return _decode_all(VARIABLES, data)
+
+    def batch(self):
+        """
+        Returns a context manager that reads all variables from the Tic at once when entered. Until it exits, the
+        variable getters return the values from that single snapshot instead of each sending its own request.
+        """
+        return _Batch(self)
 
 
-def _get_crc_7(message):
+TicBase._define_commands()
+TicBase._define_variables()
+
+
+def _build_crc_7_table():
     """
-    Calculates and returns the integrity verification byte for the given message. Used only by the serial controller.
-    For more details, see section "Cyclic Redundancy Check (CRC) error detection" at https://www.pololu.com/docs/0J71/9
+    Returns the table of CRC values for every possible byte, used by `_get_crc_7()`.
     """
-    crc = 0
-    for i in range(len(message)):
-        crc ^= message[i]
+    table = bytearray(256)
+    for i in range(256):
+        crc = i
         for j in range(8):
-            if crc & 1:
-                crc ^= 0x91
-            crc >>= 1
-    return crc.to_bytes(1, 'little')
+            # Branchless form of `if crc & 1: crc ^= 0x91` followed by `crc >>= 1`
+            crc = (crc >> 1) ^ (0x48 & -(crc & 1))
+        table[i] = crc
+    return bytes(table)
+
+
+_CRC_7_TABLE = _build_crc_7_table()
+
+
+def _crc_7_update(crc, data):
+    """
+    Continues the CRC computation from the given CRC of the preceding bytes, and returns the CRC (as an int) once the
+    given data is appended. Lets a message be checked in several fragments, e.g. a precomputed header then a payload.
+    """
+    for byte in data:
+        # Process a whole byte at a time using the precomputed table
+        crc = _CRC_7_TABLE[crc ^ byte]
+    return crc
+
+
+def _get_crc_7(message):
+    """
+    Calculates and returns the integrity verification byte (as an int) for the given message. Used only by the serial
+    controller. For more details, see section "Cyclic Redundancy Check (CRC) error detection" at
+    https://www.pololu.com/docs/0J71/9
+    """
+    return _crc_7_update(0, message)
+
+
+# 32-bit command parameter, sent as a byte holding the most significant bits followed by four 7-bit bytes
+_SERIAL_THIRTY_TWO_BITS = Struct('<BBBBB')
+
+# Serialized offset and length of the serial block reads sent so far, indexed by `offset << 8 | length`
+_SERIAL_BLOCK_READ_PAYLOADS = {}
 
 
 class TicSerial(TicBase):
@@ -491,54 +781,144 @@ class TicSerial(TicBase):
 
     def __init__(self, port, device_number=None, crc_for_commands=False, crc_for_responses=False):
         self.port = port
-        self.device_number = device_number
-        self.crc_for_commands = crc_for_commands
+        self._device_number = device_number
+        self._crc_for_commands = crc_for_commands
         self.crc_for_responses = crc_for_responses
+        # Buffer reused across reads, large enough for any block read and its CRC byte
+        self._response_buffer = bytearray(MAX_BLOCK_READ_LENGTH + 1)
+        self._reset_frames()
         super().__init__()
 
+    @property
+    def port(self):
+        return self._port
+
+    @port.setter
+    def port(self, port):
+        self._port = port
+        # Resolved once instead of on every read. Only Micropython's UART reads straight into the given buffer:
+        # pyserial's `readinto()` reads new bytes then copies them, so plain `read()` calls are cheaper there.
+        self._port_readinto = getattr(port, 'readinto', None) if _MICROPYTHON else None
+
+    @property
+    def device_number(self):
+        return self._device_number
+
+    @device_number.setter
+    def device_number(self, device_number):
+        self._device_number = device_number
+        self._reset_frames()
+
+    @property
+    def crc_for_commands(self):
+        return self._crc_for_commands
+
+    @crc_for_commands.setter
+    def crc_for_commands(self, crc_for_commands):
+        self._crc_for_commands = crc_for_commands
+        self._reset_frames()
+
+    def _reset_frames(self):
+        """
+        Precomputes the header of each command and its CRC for the current device number, as well as the serialized
+        quick commands.
+        """
+        self._headers = {}
+        # Quick commands have no parameter, so their frame (including the CRC byte) never changes
+        self._quick_commands = {}
+        for code in _COMMAND_CODES:
+            header, crc = self._get_header(code)
+            self._quick_commands[code] = header + bytes((crc,)) if self._crc_for_commands else header
+
+    def _get_header(self, command_code):
+        """
+        Returns the header of the given command and the CRC of that header. The headers of the known commands are
+        precomputed by `_reset_frames()`, others are built the first time they are used.
+        """
+        header = self._headers.get(command_code)
+        if header is None:
+            if self._device_number is None:
+                # Compact protocol
+                serialized = bytes((command_code,))
+            else:
+                # Pololu protocol
+                serialized = bytes((0xAA, self._device_number, command_code & 0x7F))
+            header = self._headers[command_code] = (serialized, _get_crc_7(serialized))
+        return header
+
     def _send_command(self, command_code, format, value=None):
         """
         Sends command to the Tic.
         """
-        if self.device_number is None:
-            # Compact protocol
-            serialized = bytes([command_code])
-        else:
-            # Pololu protocol
-            serialized = bytes([0xAA, self.device_number, command_code & 0x7F])
-
-        # Format the command parameter
-        if format == SEVEN_BITS:
-            serialized += bytes([value])
+        if format == QUICK:
+            self._send_quick(command_code)
+        elif format == SEVEN_BITS:
+            self._send_seven_bits(command_code, value)
         elif format == THIRTY_TWO_BITS:
-            serialized += bytes([
-                ((value >> 7) & 1) | ((value >> 14) & 2) | ((value >> 21) & 4) | ((value >> 28) & 8),
-                value >> 0 & 0x7F,
-                value >> 8 & 0x7F,
-                value >> 16 & 0x7F,
-                value >> 24 & 0x7F
-            ])
+            self._send_thirty_two_bits(command_code, value)
         elif format == BLOCK_READ:
-            serialized += value
+            self._write_frame(command_code, value)
+        else:
+            raise ValueError("Unknown command format: {}".format(format))
 
-        # Add CRC byte if required
-        if self.crc_for_commands:
-            serialized += _get_crc_7(serialized)
+    # Specialized versions of `_send_command()`, called directly by the command methods
 
-        # Write command to the bus
-        self.port.write(serialized)
+    def _send_quick(self, command_code):
+        frame = self._quick_commands.get(command_code)
+        if frame is None:
+            self._write_frame(command_code, b'')
+        else:
+            self._port.write(frame)
+
+    def _send_seven_bits(self, command_code, value):
+        self._write_frame(command_code, bytes((value,)))
+
+    def _send_thirty_two_bits(self, command_code, value):
+        # Pack the parameter straight into a frame of the final size, so that the frame is the only allocation
+        header, crc = self._get_header(command_code)
+        start = len(header)
+        end = start + 5
+        frame = bytearray(end + 1 if self._crc_for_commands else end)
+        frame[:start] = header
+        _SERIAL_THIRTY_TWO_BITS.pack_into(
+            frame, start,
+            # Gathers the most significant bit of each byte: the multiplication moves bits 7, 15, 23 and 31 to
+            # bits 28 to 31 without any overlapping carry
+            ((value & 0x80808080) * 0x00204081) >> 28 & 0x0F,
+            value & 0x7F,
+            value >> 8 & 0x7F,
+            value >> 16 & 0x7F,
+            value >> 24 & 0x7F)
+        if self._crc_for_commands:
+            frame[end] = _crc_7_update(crc, memoryview(frame)[start:end])
+        self._port.write(frame)
+
+    def _write_frame(self, command_code, payload):
+        """
+        Writes the given command to the bus, with its parameter and CRC byte if required. The frame is assembled in a
+        single bytearray to avoid copying it for each part.
+        """
+        header, crc = self._get_header(command_code)
+        frame = bytearray(header)
+        frame += payload
+        if self._crc_for_commands:
+            # Only the payload is processed, as the CRC of the header is precomputed
+            frame.append(_crc_7_update(crc, payload))
+        self._port.write(frame)
 
     def _block_read(self, command_code, offset, length, format_response=None):
         """
         Returns the value of the specified variable or setting from the Tic.
         """
-        # Send command requesting the value
-        if offset >= 128:
+        # Send command requesting the value. Requests only come from the fixed offsets of the variables and settings,
+        # so their parameter is only serialized once.
+        key = offset << 8 | length
+        payload = _SERIAL_BLOCK_READ_PAYLOADS.get(key)
+        if payload is None:
             # To access offsets between 128 and 255, we must set bit 6 of the length byte.
             # See https://www.pololu.com/docs/0J71/9 for more details
-            self._send_command(command_code, BLOCK_READ, bytes([offset - 128, length + 64]))
-        else:
-            self._send_command(command_code, BLOCK_READ, bytes([offset, length]))
+            payload = _SERIAL_BLOCK_READ_PAYLOADS[key] = bytes((offset & 0x7F, length | (offset >> 7) << 6))
+        self._write_frame(command_code, payload)
         # Read the returned value
         result = self._read_response(length)
         # Verify and format the returned value
@@ -547,32 +927,64 @@ class TicSerial(TicBase):
         elif len(result) != length:
             raise RuntimeError("Expected to read {} bytes, got {}.".format(length, len(result)))
         if format_response is None:
-            return result
+            # Return a copy since the buffer may be reused by the next reads
+            return bytes(result)
         else:
             return format_response(result)
 
+    def _read_into_buffer(self, size):
+        """
+        Reads the given number of bytes from the port into a buffer that is reused across reads, and returns a
+        memoryview of that buffer. Only used on Micropython, to avoid allocating new bytes for every response.
+        """
+        if size > len(self._response_buffer):
+            return self._port.read(size)
+        response = memoryview(self._response_buffer)[:size]
+        count = self._port_readinto(response)
+        if count is None:
+            # The read timed out (Micropython)
+            return None
+        return response[:count]
+
     def _read_response(self, length):
         """
         Reads and returns the variable or setting returned by the Tic.
         """
+        # Read extra byte at the end of the response if it contains a CRC
+        size = length + 1 if self.crc_for_responses else length
+        if self._port_readinto is None:
+            response = self._port.read(size)
+        else:
+            response = self._read_into_buffer(size)
         if self.crc_for_responses:
-            # Read extra byte at the end of the response
-            response = self.port.read(length + 1)
             if len(response) != length + 1:
                 raise RuntimeError("Response does not contain CRC byte")
-            # Extract the main message and CRC from the response
-            message = response[0:length]
-            # Oddly, response[-1] returns an int instead of a byte, so we use this more convoluted notation:
-            crc = int.to_bytes(
-                response[-1], 1, 'little')
-            # Verify that the CRC byte returned by the Tic is correct
-            if crc == _get_crc_7(message):
-                # Success: the CRC byte is correct
-                return message
+            # Verify that the CRC byte returned by the Tic is correct. The CRC of the most common response lengths
+            # (single variables and settings) is unrolled to avoid the loop in `_get_crc_7()`.
+            table = _CRC_7_TABLE
+            if length == 1:
+                crc = table[response[0]]
+            elif length == 2:
+                crc = table[table[response[0]] ^ response[1]]
+            elif length == 4:
+                crc = table[table[table[table[response[0]] ^ response[1]] ^ response[2]] ^ response[3]]
+            else:
+                # Read the main message through a memoryview to avoid copying it just to compute its CRC
+                crc = _get_crc_7(memoryview(response)[:length])
+            if response[-1] == crc:
+                # Success: the CRC byte is correct. Extract the main message from the response.
+                return response[:length]
             else:
                 raise RuntimeError("Response CRC check failed")
         else:
-            return self.port.read(length)
+            return response
+
+
+# Command code followed by its 32-bit parameter in little-endian order
+_I2C_THIRTY_TWO_BITS = Struct('<BI')
+
+# Serialized I2C block read requests sent so far, indexed by `command_code << 16 | offset << 8 | length`
+_I2C_BLOCK_READ_REQUESTS = {}
 
 
 class TicI2C(TicBase):
@@ -589,27 +1001,39 @@ class TicI2C(TicBase):
         """
         Sends command to the Tic.
         """
-        serialized = bytes([command_code])
-        # Format the command parameter
-        if format == SEVEN_BITS:
-            serialized += bytes([value])
+        if format == QUICK:
+            self._send_quick(command_code)
+        elif format == SEVEN_BITS:
+            self._send_seven_bits(command_code, value)
         elif format == THIRTY_TWO_BITS:
-            serialized += bytes([
-                value >> 0 & 0xFF,
-                value >> 8 & 0xFF,
-                value >> 16 & 0xFF,
-                value >> 24 & 0xFF
-            ])
+            self._send_thirty_two_bits(command_code, value)
         elif format == BLOCK_READ:
-            serialized += value
-        # Write command to the bus
-        self.backend.write(serialized)
+            self.backend.write(_get_command_bytes(command_code) + value)
+        else:
+            raise ValueError("Unknown command format: {}".format(format))
+
+    # Specialized versions of `_send_command()`, called directly by the command methods
+
+    def _send_quick(self, command_code):
+        self.backend.write(_get_command_bytes(command_code))
+
+    def _send_seven_bits(self, command_code, value):
+        self.backend.write(bytes((command_code, value)))
+
+    def _send_thirty_two_bits(self, command_code, value):
+        # Negative values are sent in two's complement
+        self.backend.write(_I2C_THIRTY_TWO_BITS.pack(command_code, value & 0xFFFFFFFF))
 
     def _block_read(self, command_code, offset, length, format_response=None):
         """
         Returns the value of the specified variable or setting from the Tic.
         """
-        self._send_command(command_code, BLOCK_READ, bytes([offset, length]))
+        # Requests only come from the fixed offsets of the variables and settings, so each one is serialized only once
+        key = command_code << 16 | offset << 8 | length
+        request = _I2C_BLOCK_READ_REQUESTS.get(key)
+        if request is None:
+            request = _I2C_BLOCK_READ_REQUESTS[key] = bytes((command_code, offset, length))
+        self.backend.write(request)
         result = self.backend.read(length)
         if len(result) != length:
             raise RuntimeError("Expected to read {} bytes, got {}.".format(length, len(result)))
@@ -625,8 +1049,12 @@ class TicUSB(TicBase):
     Reference: https://www.pololu.com/docs/0J71/11
     """
 
+    max_block_read_length = MAX_USB_BLOCK_READ_LENGTH
+
     def __init__(self, product=None, serial_number=None):
-        if usb_core is None:
+        try:
+            import usb.core as usb_core
+        except ImportError:
             raise Exception("Missing dependency: pyusb")
         params = dict(idVendor=VENDOR)
         if product is not None:
@@ -637,6 +1065,10 @@ class TicUSB(TicBase):
         if self.usb is None:
             raise Exception('USB device not found')
         self.usb.set_configuration()
+        # Bound once, as every command and block read goes through it
+        self._ctrl_transfer = self.usb.ctrl_transfer
+        # Buffers reused across block reads, indexed by length
+        self._read_buffers = {}
         super().__init__()
 
     def _send_command(self, command_code, format, value=None):
@@ -644,20 +1076,39 @@ class TicUSB(TicBase):
         Sends command to the Tic.
         """
         if format == QUICK:
-            self.usb.ctrl_transfer(0x40, command_code, 0, 0, 0)
+            self._send_quick(command_code)
         elif format == SEVEN_BITS:
-            self.usb.ctrl_transfer(0x40, command_code, value, 0, 0)
+            self._send_seven_bits(command_code, value)
         elif format == THIRTY_TWO_BITS:
-            self.usb.ctrl_transfer(0x40, command_code, value & 0xFFFF, value >> 16 & 0xFFFF, 0)
+            self._send_thirty_two_bits(command_code, value)
+        else:
+            raise ValueError("Unknown command format: {}".format(format))
+
+    # Specialized versions of `_send_command()`, called directly by the command methods
+
+    def _send_quick(self, command_code):
+        self._ctrl_transfer(0x40, command_code, 0, 0, 0)
+
+    def _send_seven_bits(self, command_code, value):
+        self._ctrl_transfer(0x40, command_code, value, 0, 0)
+
+    def _send_thirty_two_bits(self, command_code, value):
+        self._ctrl_transfer(0x40, command_code, value & 0xFFFF, value >> 16 & 0xFFFF, 0)
 
     def _block_read(self, command_code, offset, length, format_response=None):
         """
         Returns the value of the specified variable or setting from the Tic.
         """
-        result = self.usb.ctrl_transfer(0xC0, command_code, 0, offset, length)
-        if len(result) != length:
-            raise RuntimeError("Expected to read {} bytes, got {}.".format(length, len(result)))
+        buffer = self._read_buffers.get(length)
+        if buffer is None:
+            buffer = self._read_buffers[length] = array('B', bytes(length))
+        # Passing an array makes pyusb read into it and return the number of bytes read, instead of allocating a new
+        # array for every transfer
+        read_length = self._ctrl_transfer(0xC0, command_code, 0, offset, buffer)
+        if read_length != length:
+            raise RuntimeError("Expected to read {} bytes, got {}.".format(length, read_length))
         if format_response is None:
-            return result
+            # Return a copy since the buffer is reused by the next reads
+            return bytes(buffer)
         else:
-            return format_response(result)
+            return format_response(buffer)
@@ -49,6 +49,24 @@ class MockSerialPort(object):
         self.writes.append(serialized)
 
 
+class MockReadintoSerialPort(MockSerialPort):
+    """
+    Serial port that also supports reading into a given buffer, like pyserial and Micropython's UART.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.readinto_calls = 0
+
+    def readinto(self, buffer):
+        self.readinto_calls += 1
+        value = self.read(len(buffer))
+        if value is None:
+            return None
+        buffer[:len(value)] = value
+        return len(value)
+
+
 class MockI2CBackend(object):
 
     def __init__(self):
@@ -72,12 +90,31 @@ def int_to_bytes(value, length):
     return value.to_bytes(length, 'little')
 
 
+def get_crc_7(message):
+    """
+    Reference bit-by-bit implementation of the CRC used by the serial protocol.
+    """
+    crc = 0
+    for byte in message:
+        crc ^= byte
+        for _ in range(8):
+            if crc & 1:
+                crc ^= 0x91
+            crc >>= 1
+    return bytes([crc])
+
+
 class Tests(object):
 
     def test_serial_variable(self):
         tic = TicSerial(MockSerialPort())
         tic.port.set_returned_values([int_to_bytes(99, 4)])
         assert tic.get_current_position() == 99
+        assert tic.port.writes[-1] == b'\xa1\x22\x04'
+        # Offsets above 127 set bit 6 of the length byte
+        tic.port.set_returned_values([int_to_bytes(7, 1)])
+        assert tic.get_last_hp_driver_errors() == b'\x07'
+        assert tic.port.writes[-1] == b'\xa1\x7f\x41'
 
     def test_serial_commands(self):
         tic = TicSerial(MockSerialPort())
@@ -91,10 +128,128 @@ class Tests(object):
         tic.energize()
         assert tic.port.writes[-1] == b'\x85'
 
+    def test_serial_thirty_two_bits(self):
+        """
+        Ensure that 32-bit parameters are split into a byte of most significant bits followed by four 7-bit bytes.
+        """
+        tic = TicSerial(MockSerialPort())
+        values = [0, 1, -1, 0x7F, 0x80, 0x80808080, -(1 << 31), (1 << 31) - 1]
+        values += list(range(-(1 << 31), 1 << 31, 0x1000193))
+        for value in values:
+            tic.set_target_position(value)
+            expected = bytes([
+                0xE0,
+                ((value >> 7) & 1) | ((value >> 14) & 2) | ((value >> 21) & 4) | ((value >> 28) & 8),
+                value & 0x7F,
+                value >> 8 & 0x7F,
+                value >> 16 & 0x7F,
+                value >> 24 & 0x7F,
+            ])
+            assert tic.port.writes[-1] == expected, value
+
+    def test_unknown_command_code(self):
+        """
+        Ensure that command codes missing from the command tables are still serialized.
+        """
+        tic = TicSerial(MockSerialPort(), device_number=14, crc_for_commands=True)
+        tic._send_command(0x93, 'QUICK')
+        assert tic.port.writes[-1] == b'\xaa\x0e\x13' + get_crc_7(b'\xaa\x0e\x13')
+        tic._send_command(0x93, 'SEVEN_BITS', 2)
+        assert tic.port.writes[-1] == b'\xaa\x0e\x13\x02' + get_crc_7(b'\xaa\x0e\x13\x02')
+        tic.port.set_returned_values([b'\x07'])
+        assert tic._block_read(0xA2, 0x00, 1) == b'\x07'
+        assert tic.port.writes[-1] == b'\xaa\x0e\x22\x00\x01' + get_crc_7(b'\xaa\x0e\x22\x00\x01')
+        tic = TicI2C(MockI2CBackend())
+        tic._send_command(0xA2, 'BLOCK_READ', b'\x00\x01')
+        assert tic.backend.writes[-1] == b'\xa2\x00\x01'
+        tic._send_command(0x13, 'QUICK')
+        assert tic.backend.writes[-1] == b'\x13'
+
+    def test_unknown_command_format(self):
+        """
+        Ensure that commands with an unknown format are rejected instead of being silently dropped.
+        """
+        for tic in [TicSerial(MockSerialPort()), TicI2C(MockI2CBackend()), TicUSB()]:
+            try:
+                tic._send_command(0x85, 'UNKNOWN')
+            except ValueError as excinfo:
+                assert str(excinfo) == "Unknown command format: UNKNOWN"
+            else:
+                raise Exception()
+
+    def test_serial_crc(self):
+        tic = TicSerial(MockSerialPort(), crc_for_commands=True, crc_for_responses=True)
+        tic.set_target_position(-99)
+        assert tic.port.writes[-1] == b'\xe0\x0f\x1d\x7f\x7f\x7f' + get_crc_7(b'\xe0\x0f\x1d\x7f\x7f\x7f')
+        tic.energize()
+        assert tic.port.writes[-1] == b'\x85' + get_crc_7(b'\x85')
+        # Cached quick commands are reserialized when the settings change
+        tic.device_number = 14
+        tic.energize()
+        assert tic.port.writes[-1] == b'\xaa\x0e\x05' + get_crc_7(b'\xaa\x0e\x05')
+        tic.set_target_position(-99)
+        frame = b'\xaa\x0e\x60\x0f\x1d\x7f\x7f\x7f'
+        assert tic.port.writes[-1] == frame + get_crc_7(frame)
+        tic.crc_for_commands = False
+        tic.energize()
+        assert tic.port.writes[-1] == b'\xaa\x0e\x05'
+        response = int_to_bytes(-99, 4)
+        tic.port.set_returned_values([response + get_crc_7(response)])
+        assert tic.get_current_position() == -99
+        tic.port.set_returned_values([response + b'\x00'])
+        try:
+            tic.get_current_position()
+        except RuntimeError as excinfo:
+            assert str(excinfo) == "Response CRC check failed"
+        else:
+            raise Exception()
+        # Responses of every length are verified the same way
+        for length in range(1, 6):
+            response = bytes(range(0x30, 0x30 + length))
+            tic.port.set_returned_values([response + get_crc_7(response)])
+            assert tic._block_read(0xA1, 0x00, length) == response
+            tic.port.set_returned_values([response + bytes([get_crc_7(response)[0] ^ 1])])
+            try:
+                tic._block_read(0xA1, 0x00, length)
+            except RuntimeError as excinfo:
+                assert str(excinfo) == "Response CRC check failed"
+            else:
+                raise Exception()
+
+    def test_serial_readinto(self):
+        """
+        Ensure that responses are read into the reused buffer on Micropython only.
+        """
+        tic = TicSerial(MockReadintoSerialPort(), crc_for_responses=True)
+        tic.port.set_returned_values([int_to_bytes(99, 4) + get_crc_7(int_to_bytes(99, 4))])
+        assert tic.get_current_position() == 99
+        assert tic.port.readinto_calls == (1 if sys.implementation.name == 'micropython' else 0)
+        # Exercise the buffer path regardless of the implementation
+        tic._port_readinto = tic.port.readinto
+        response = int_to_bytes(-99, 4)
+        tic.port.set_returned_values([response + get_crc_7(response)])
+        assert tic.get_current_position() == -99
+        tic.port.set_returned_values([b'\x07' + get_crc_7(b'\x07')])
+        value = tic.get_last_hp_driver_errors()
+        assert value == b'\x07' and isinstance(value, bytes)
+        # Raw values are copies that aren't overwritten by the next reads
+        tic.port.set_returned_values([b'\x08' + get_crc_7(b'\x08')])
+        tic.get_last_hp_driver_errors()
+        assert value == b'\x07'
+        tic.crc_for_responses = False
+        tic.port.set_returned_values([int_to_bytes(99, 4)])
+        assert tic.get_current_position() == 99
+        assert tic.port.readinto_calls > 0
+        # Replacing the port picks up whether the new one supports `readinto()`
+        tic.port = MockSerialPort()
+        tic.port.set_returned_values([int_to_bytes(42, 4)])
+        assert tic.get_current_position() == 42
+
     def test_i2c_variable(self):
         tic = TicI2C(MockI2CBackend())
         tic.backend.set_returned_values([int_to_bytes(99, 4)])
         assert tic.get_current_position() == 99
+        assert tic.backend.writes[-1] == b'\xa1\x22\x04'
 
     def test_i2c_commands(self):
         tic = TicI2C(MockI2CBackend())
@@ -112,6 +267,14 @@ class Tests(object):
         tic = TicUSB()
         tic.usb.set_returned_values([int_to_bytes(99, 4)])
         assert tic.get_current_position() == 99
+        # Raw values are returned as bytes, like with the other controllers, rather than pyusb's array
+        tic.usb.set_returned_values([b'\x07'])
+        value = tic.get_last_hp_driver_errors()
+        assert value == b'\x07' and isinstance(value, bytes)
+        # The returned value is a copy that isn't overwritten by the next reads
+        tic.usb.set_returned_values([b'\x08'])
+        tic.get_last_hp_driver_errors()
+        assert value == b'\x07'
 
     def test_usb_commands(self):
         tic = TicUSB()
@@ -157,10 +320,24 @@ class Tests(object):
         tic.usb.set_returned_values([int_to_bytes(0b00001000, 1)])
         assert tic.settings.get_serial_14bit_device_number() is True
 
+    def test_bit_range(self):
+        """
+        Ensure that bit ranges are correctly extracted from bytes, ignoring the surrounding bits.
+        """
+        tic = TicUSB()
+        tic.usb.set_returned_values([int_to_bytes(0b11011010, 1)])
+        assert tic.settings.get_scl_pin_function() == 0b1010
+        tic.usb.set_returned_values([int_to_bytes(0b11110000, 1)])
+        assert tic.settings.get_scl_pin_function() == 0
+        tic.usb.set_returned_values([int_to_bytes(0b11111111, 1), int_to_bytes(0b11111111, 1)])
+        assert tic.settings.get_serial_device_number() == 0b11111111111111
+
     def test_signed_int(self):
         tic = TicUSB()
         tic.usb.set_returned_values([int_to_bytes(-99, 4)])
         assert tic.get_target_position() == -99
+        tic.usb.set_returned_values([(-99 + 2**16).to_bytes(2, 'little')])
+        assert tic.settings.get_vin_calibration() == -99
 
     def test_unsigned_int(self):
         tic = TicUSB()
@@ -174,8 +351,81 @@ class Tests(object):
 
     def test_get_serial_alt_device_number(self):
         tic = TicUSB()
-        tic.usb.set_returned_values([int_to_bytes(0b00000010, 1), int_to_bytes(0b00000100, 1)])
+        # Both bytes are adjacent, so they are fetched with a single block read
+        tic.usb.set_returned_values([int_to_bytes(0b0000010000000010, 2)])
         assert tic.settings.get_serial_alt_device_number() == 0b00001000000010
+        assert tic.usb.calls == [(0xC0, 0xA8, 0, 0x6A, 2)]
+
+    def test_settings_get_all(self):
+        """
+        Ensure that all settings are fetched with a few block reads and decoded like the individual getters.
+        """
+        tic = TicUSB()
+        tic.usb.set_memory(bytes(range(256)))
+        settings = tic.settings.get_all()
+        # Over USB, each contiguous range of settings is fetched with a single control transfer
+        assert tic.usb.calls == [(0xC0, 0xA8, 0, 1, 111), (0xC0, 0xA8, 0, 246, 6)]
+        for name, value in settings.items():
+            assert value == getattr(tic.settings, 'get_' + name)(), name
+        assert settings['control_mode'] == 0x01
+        assert settings['serial_device_number'] == 0x07 | (0x69 << 7)
+        assert settings['hp_decay_mode'] == 0xFB
+
+    def test_settings_cache(self):
+        """
+        Ensure that settings are read from the cache after a refresh, until the cache is invalidated.
+        """
+        tic = TicUSB()
+        tic.usb.set_memory(bytes(range(256)))
+        tic.settings.refresh()
+        calls = len(tic.usb.calls)
+        assert tic.settings.get_control_mode() == 0x01
+        assert tic.settings.get_serial_device_number() == 0x07 | (0x69 << 7)
+        assert tic.settings.get_all()['hp_decay_mode'] == 0xFB
+        assert len(tic.usb.calls) == calls
+        assert tic.settings.get_control_mode(fresh=True) == 0x01
+        assert len(tic.usb.calls) == calls + 1
+        tic.settings.invalidate()
+        tic.settings.get_control_mode()
+        assert len(tic.usb.calls) == calls + 2
+
+    def test_get_variables(self):
+        """
+        Ensure that all variables are fetched with a few block reads and decoded like the individual getters.
+        """
+        tic = TicUSB()
+        tic.usb.set_memory(bytes(range(256)))
+        variables = tic.get_variables()
+        assert tic.usb.calls == [(0xC0, 0xA1, 0, 0x00, 0x5A), (0xC0, 0xA1, 0, 0xFF, 1)]
+        for name, value in variables.items():
+            assert value == getattr(tic, 'get_' + name)(), name
+        assert variables['operation_state'] == 0x00
+        assert variables['current_position'] == int.from_bytes(bytes([0x22, 0x23, 0x24, 0x25]), 'little')
+        assert variables['last_hp_driver_errors'] == bytes([0xFF])
+        # Serial and I2C block reads are limited to 15 bytes
+        tic = TicSerial(MockSerialPort())
+        tic.port.set_returned_values([bytes(15)] * 6 + [bytes(1)])
+        tic.get_variables()
+        assert len(tic.port.writes) == 7
+
+    def test_batch(self):
+        """
+        Ensure that variable getters read from a single snapshot inside a batch.
+        """
+        tic = TicUSB()
+        tic.usb.set_memory(bytes(range(256)))
+        expected = tic.get_variables()
+        tic.usb.calls = []
+        with tic.batch():
+            assert len(tic.usb.calls) == 2
+            # Change the memory to make sure that the snapshot is used
+            tic.usb.set_memory(bytes(256))
+            for name, value in expected.items():
+                assert getattr(tic, 'get_' + name)() == value, name
+            assert tic.get_variables() == expected
+            assert len(tic.usb.calls) == 2
+        assert tic.get_current_position() == 0
+        assert len(tic.usb.calls) == 3
 
 
 if __name__ == '__main__':
@@ -24,19 +24,42 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from array import array
+
+
 class MockUSB(object):
 
     def __init__(self):
         self.calls = []
         self.returned_values = None
+        self.memory = None
 
     def set_returned_values(self, values):
         self.returned_values = values
 
+    def set_memory(self, memory):
+        """
+        Sets the bytes returned by block reads, indexed by offset.
+        """
+        self.memory = memory
+
     def ctrl_transfer(self, bmRequestType, bRequest, wValue, wIndex, data_or_wLength):
+        buffer = None
+        if isinstance(data_or_wLength, array):
+            # Like pyusb, read into the given array and return the number of bytes read
+            buffer = data_or_wLength
+            data_or_wLength = len(buffer)
         self.calls.append((bmRequestType, bRequest, wValue, wIndex, data_or_wLength))
+        result = None
         if self.returned_values:
-            return self.returned_values.pop(0)
+            result = self.returned_values.pop(0)
+        elif self.memory is not None and bmRequestType == 0xC0:
+            result = self.memory[wIndex:wIndex + data_or_wLength]
+        if buffer is None or result is None:
+            return result
+        result = result[:len(buffer)]
+        buffer[:len(result)] = array('B', result)
+        return len(result)
 
     def set_configuration(self):
         pass